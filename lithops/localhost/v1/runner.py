@@ -19,16 +19,18 @@ import sys
 import json
 import platform
 import logging
-import uuid
+import secrets
 import multiprocessing as mp
 from pathlib import Path
 
+from lithops.utils import json_loads
 from lithops.worker import function_handler
 from lithops.worker.utils import get_runtime_metadata
 from lithops.constants import LITHOPS_TEMP_DIR, JOBS_DIR, LOGS_DIR, \
     RN_LOG_FILE, LOGGER_FORMAT
 
-log_file_stream = open(RN_LOG_FILE, 'a')
+# Larger buffer to batch the output of the user functions, redirected to this file
+log_file_stream = open(RN_LOG_FILE, 'a', buffering=64 * 1024)
 
 os.makedirs(LITHOPS_TEMP_DIR, exist_ok=True)
 os.makedirs(JOBS_DIR, exist_ok=True)
@@ -53,7 +55,7 @@ def run_job():
     logger.info(f'Got {job_filename} job file')
 
     with open(job_filename, 'rb') as jf:
-        job_payload = json.load(jf)
+        job_payload = json_loads(jf.read())
 
     executor_id = job_payload['executor_id']
     job_id = job_payload['job_id']
@@ -61,7 +63,7 @@ def run_job():
 
     logger.info(f'ExecutorID {executor_id} | JobID {job_id} - Starting execution')
 
-    act_id = str(uuid.uuid4()).replace('-', '')[:12]
+    act_id = secrets.token_hex(6)
     os.environ['__LITHOPS_ACTIVATION_ID'] = act_id
     os.environ['__LITHOPS_BACKEND'] = 'Localhost'
 
@@ -222,7 +222,7 @@ class ExecutionEnvironment:
             task_payload = copy.deepcopy(job_payload)
             task_payload['call_ids'] = [call_id]
             task_payload['data_byte_ranges'] = [dbr[int(call_id)]]
-            self.work_queue.put(json.dumps(task_payload))
+            self.work_queue.put((job_key, call_id, json.dumps(task_payload, default=str)))
 
     def start(self):
         """
@@ -232,28 +232,17 @@ class ExecutionEnvironment:
         if self.consumer_threads:
             return
 
-        def process_task(task_payload_str):
-            task_payload = json.loads(task_payload_str)
-            job_key = task_payload['job_key']
-            call_id = task_payload['call_ids'][0]
-
-            task_filename = os.path.join(JOBS_DIR, job_key, call_id + '.task')
-            with open(task_filename, 'w') as jl:
-                json.dump(task_payload, jl, default=str)
-
-            self.run_task(job_key, call_id)
-
-            if os.path.exists(task_filename):
-                os.remove(task_filename)
-
+        def process_task(task):
+            job_key, call_id, task_payload_str = task
+            self.run_task(job_key, call_id, task_payload_str)
             self.jobs[job_key].unlock()
 
         def queue_consumer(work_queue):
             while True:
-                task_payload_str = work_queue.get()
-                if task_payload_str is None:
+                task = work_queue.get()
+                if task is None:
                     break
-                process_task(task_payload_str)
+                process_task(task)
 
         logger.debug("Starting Localhost work queue consumer threads")
         for _ in range(self.worker_processes):
@@ -312,18 +301,17 @@ class DefaultEnvironment(ExecutionEnvironment):
 
         super().start()
 
-    def run_task(self, job_key, call_id):
+    def run_task(self, job_key, call_id, task_payload_str):
         """
-        Runs a task
+        Runs a task. The task payload is streamed through the process stdin
         """
         job_key_call_id = f'{job_key}-{call_id}'
-        task_filename = os.path.join(JOBS_DIR, job_key, call_id + '.task')
 
         logger.debug(f"Going to execute task process {job_key_call_id}")
-        cmd = [self.runtime_name, RUNNER_FILE, 'run_job', task_filename]
-        process = sp.Popen(cmd, stdout=sp.PIPE, stderr=sp.PIPE, start_new_session=True)
+        cmd = [self.runtime_name, RUNNER_FILE, 'run_job', '-']
+        process = sp.Popen(cmd, stdin=sp.PIPE, stdout=sp.PIPE, stderr=sp.PIPE, start_new_session=True)
         self.task_processes[job_key_call_id] = process
-        process.communicate()  # blocks until the process finishes
+        process.communicate(input=task_payload_str.encode())  # blocks until the process finishes
         if process.returncode != 0:
             logger.error(f"Task process {job_key_call_id} failed with return code {process.returncode}")
         del self.task_processes[job_key_call_id]
@@ -423,11 +411,15 @@ class ContainerEnvironment(ExecutionEnvironment):
 
         super().start()
 
-    def run_task(self, job_key, call_id):
+    def run_task(self, job_key, call_id, task_payload_str):
         """
         Runs a task
         """
         job_key_call_id = f'{job_key}-{call_id}'
+        task_filename = os.path.join(JOBS_DIR, job_key, call_id + '.task')
+        with open(task_filename, 'w') as jl:
+            jl.write(task_payload_str)
+
         docker_job_dir = f'/tmp/{USER_TEMP_DIR}/jobs/{job_key}'
         docker_task_filename = f'{docker_job_dir}/{call_id}.task'
 
@@ -443,6 +435,9 @@ class ContainerEnvironment(ExecutionEnvironment):
             logger.error(f"Task process {job_key_call_id} failed with return code {process.returncode}")
         logger.debug(f"Task process {job_key_call_id} finished")
 
+        if os.path.exists(task_filename):
+            os.remove(task_filename)
+
     def stop(self, job_keys=None):
         """
         Stop localhost container
@@ -19,9 +19,10 @@ import sys
 import json
 import platform
 import logging
-import uuid
+import secrets
 import multiprocessing as mp
 
+from lithops.utils import json_loads
 from lithops.worker import function_handler
 from lithops.worker.utils import get_runtime_metadata
 from lithops.constants import (
@@ -37,7 +38,8 @@ os.makedirs(LITHOPS_TEMP_DIR, exist_ok=True)
 os.makedirs(JOBS_DIR, exist_ok=True)
 os.makedirs(LOGS_DIR, exist_ok=True)
 
-log_file_stream = open(RN_LOG_FILE, 'a')
+# Larger buffer to batch the output of the user functions, redirected to this file
+log_file_stream = open(RN_LOG_FILE, 'a', buffering=64 * 1024)
 logging.basicConfig(stream=log_file_stream, level=logging.DEBUG, format=LOGGER_FORMAT)
 logger = logging.getLogger('lithops.localhost.runner')
 
@@ -52,10 +54,14 @@ def run_job():
     sys.stderr = log_file_stream
 
     task_filename = sys.argv[2]
-    logger.info(f'Got {task_filename} file')
 
-    with open(task_filename, 'rb') as jf:
-        task_payload = json.load(jf)
+    if task_filename == '-':
+        logger.info('Reading task payload from stdin')
+        task_payload = json_loads(sys.stdin.buffer.read())
+    else:
+        logger.info(f'Got {task_filename} file')
+        with open(task_filename, 'rb') as jf:
+            task_payload = json_loads(jf.read())
 
     executor_id = task_payload['executor_id']
     job_id = task_payload['job_id']
@@ -63,7 +69,7 @@ def run_job():
 
     logger.info(f'ExecutorID {executor_id} | JobID {job_id} | CallID {call_id} - Starting execution')
 
-    act_id = str(uuid.uuid4()).replace('-', '')[:12]
+    act_id = secrets.token_hex(6)
     os.environ['__LITHOPS_ACTIVATION_ID'] = act_id
     os.environ['__LITHOPS_BACKEND'] = 'Localhost'
 
@@ -15,10 +15,33 @@
 #
 
 import os
+import json
+import pika
 import shutil
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 FH_ZIP_LOCATION = os.path.join(os.getcwd(), 'lithops_singularity.zip')
 
+RUNTIME_META_TIMEOUT = 600  # Default: 10 minutes
+
+# Shared properties for the messages published to RabbitMQ queues
+AMQP_PERSISTENT_PROPERTIES = pika.BasicProperties(
+    delivery_mode=pika.spec.PERSISTENT_DELIVERY_MODE
+)
+
+
+def encode_message(message):
+    """
+    Serializes a RabbitMQ message as compact JSON bytes
+    """
+    if orjson:
+        return orjson.dumps(message)
+    return json.dumps(message, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 DEFAULT_CONFIG_KEYS = {
     'runtime_timeout': 600,  # Default: 10 minutes
     'runtime_memory': 512,  # Default memory: 512 MB
@@ -25,11 +25,19 @@ from multiprocessing import Value, cpu_count
 from threading import Thread
 
 from lithops.version import __version__
-from lithops.utils import setup_lithops_logger, b64str_to_dict, dict_to_b64str
+from lithops.utils import (
+    setup_lithops_logger,
+    b64str_to_dict,
+    dict_to_b64str
+)
 from lithops.worker import function_handler
 from lithops.worker.utils import get_runtime_metadata
 from lithops.constants import JOBS_PREFIX
 from lithops.storage.storage import InternalStorage
+from lithops.serverless.backends.singularity.config import (
+    encode_message,
+    AMQP_PERSISTENT_PROPERTIES
+)
 
 logger = logging.getLogger('lithops.worker')
 
@@ -90,10 +98,8 @@ def manage_work_queue(ch, method, payload):
         ch.basic_publish(
             exchange='',
             routing_key='task_queue',
-            body=json.dumps(message_to_send),
-            properties=pika.BasicProperties(
-                delivery_mode=pika.spec.PERSISTENT_DELIVERY_MODE
-            ))
+            body=encode_message(message_to_send),
+            properties=AMQP_PERSISTENT_PROPERTIES)
 
     logger.info(f"Starting {processes_to_start} processes")
 
@@ -17,10 +17,11 @@
 import os
 import pika
 import hashlib
+import functools
 import json
 import logging
-import copy
 import time
+import tempfile
 
 from lithops import utils
 from lithops.version import __version__
@@ -32,6 +33,14 @@ from . import config
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def format_job_name(runtime_name, runtime_memory, version=__version__):
+    name = f'{runtime_name}-{runtime_memory}-{version}'
+    name_hash = hashlib.sha1(name.encode()).hexdigest()[:10]
+
+    return f'lithops-worker-{version.replace(".", "")}-{name_hash}'
+
+
 class SingularityBackend:
     """
     A wrap-up around Singularity backend.
@@ -45,19 +54,40 @@ class SingularityBackend:
         self.internal_storage = internal_storage
         self.amqp_url = self.singularity_config['amqp_url']
 
-        # Init rabbitmq
-        params = pika.URLParameters(self.amqp_url)
-        self.connection = pika.BlockingConnection(params)
-        self.channel = self.connection.channel()
+        # RabbitMQ connection is opened on first use
+        self._connection = None
+        self._channel = None
 
         msg = COMPUTE_CLI_MSG.format('Singularity')
         logger.info(f"{msg}")
 
-    def _format_job_name(self, runtime_name, runtime_memory, version=__version__):
-        name = f'{runtime_name}-{runtime_memory}-{version}'
-        name_hash = hashlib.sha1(name.encode()).hexdigest()[:10]
+    def _connect(self):
+        """
+        Opens the RabbitMQ connection, retrying once if the broker
+        is not reachable
+        """
+        params = pika.URLParameters(self.amqp_url)
+        try:
+            self._connection = pika.BlockingConnection(params)
+        except pika.exceptions.AMQPConnectionError as e:
+            logger.debug(f'RabbitMQ connection failed ({e}), retrying')
+            time.sleep(1)
+            self._connection = pika.BlockingConnection(params)
+
+    @property
+    def connection(self):
+        if self._connection is None or self._connection.is_closed:
+            self._connect()
+        return self._connection
+
+    @property
+    def channel(self):
+        if self._channel is None or self._channel.is_closed:
+            self._channel = self.connection.channel()
+        return self._channel
 
-        return f'lithops-worker-{version.replace(".", "")}-{name_hash}'
+    def _format_job_name(self, runtime_name, runtime_memory, version=__version__):
+        return format_job_name(runtime_name, runtime_memory, version)
 
     def _get_default_runtime_image_name(self):
         """
@@ -103,9 +133,9 @@ class SingularityBackend:
         Builds the default runtime
         """
         # Build default runtime using local dokcer
-        singularityfile = 'singularity_template.def'
+        fd, singularityfile = tempfile.mkstemp(prefix='singularity_', suffix='.def')
 
-        with open(singularityfile, 'w') as f:
+        with os.fdopen(fd, 'w') as f:
             f.write("Bootstrap: docker\n")
             f.write(f"From: python:{utils.CURRENT_PY_VERSION}-slim-buster\n")
             f.write(config.SINGULARITYFILE_DEFAULT)
@@ -162,16 +192,25 @@ class SingularityBackend:
         granularity = self.singularity_config['worker_processes']
         times, res = divmod(job_payload['total_calls'], granularity)
 
+        call_ids = job_payload['call_ids']
+        data_byte_ranges = job_payload['data_byte_ranges']
+        base_payload = {
+            k: v for k, v in job_payload.items()
+            if k not in ('call_ids', 'data_byte_ranges', 'total_calls')
+        }
+
         for i in range(times + (1 if res != 0 else 0)):
             num_tasks = granularity if i < times else res
-            payload_edited = job_payload.copy()
 
             start_index = i * granularity
             end_index = start_index + num_tasks
 
-            payload_edited['call_ids'] = payload_edited['call_ids'][start_index:end_index]
-            payload_edited['data_byte_ranges'] = payload_edited['data_byte_ranges'][start_index:end_index]
-            payload_edited['total_calls'] = num_tasks
+            payload_edited = {
+                **base_payload,
+                'call_ids': call_ids[start_index:end_index],
+                'data_byte_ranges': data_byte_ranges[start_index:end_index],
+                'total_calls': num_tasks
+            }
 
             message = {
                 'action': 'send_task',
@@ -181,10 +220,8 @@ class SingularityBackend:
             self.channel.basic_publish(
                 exchange='',
                 routing_key='task_queue',
-                body=json.dumps(message),
-                properties=pika.BasicProperties(
-                    delivery_mode=pika.spec.PERSISTENT_DELIVERY_MODE
-                ))
+                body=config.encode_message(message),
+                properties=config.AMQP_PERSISTENT_PROPERTIES)
 
         activation_id = f'lithops-{job_key.lower()}'
 
@@ -195,9 +232,11 @@ class SingularityBackend:
 
         logger.info(f"Extracting metadata from: {singularity_image_name}")
 
-        payload = copy.deepcopy(self.internal_storage.storage.config)
-        payload['runtime_name'] = runtime_name
-        payload['log_level'] = logger.getEffectiveLevel()
+        payload = {
+            **self.internal_storage.storage.config,
+            'runtime_name': runtime_name,
+            'log_level': logger.getEffectiveLevel()
+        }
         encoded_payload = utils.dict_to_b64str(payload)
 
         message = {
@@ -209,22 +248,26 @@ class SingularityBackend:
         self.channel.basic_publish(
             exchange='',
             routing_key='task_queue',
-            body=json.dumps(message),
-            properties=pika.BasicProperties(
-                delivery_mode=pika.spec.PERSISTENT_DELIVERY_MODE
-            ))
+            body=config.encode_message(message),
+            properties=config.AMQP_PERSISTENT_PROPERTIES)
 
         logger.debug("Waiting for runtime metadata")
 
-        for i in range(0, 300):
+        runtime_meta = None
+        data_key = '/'.join([JOBS_PREFIX, runtime_name + '.meta'])
+        sleep_time = 0.2
+        start = time.time()
+
+        while time.time() - start < config.RUNTIME_META_TIMEOUT:
             try:
-                data_key = '/'.join([JOBS_PREFIX, runtime_name + '.meta'])
                 json_str = self.internal_storage.get_data(key=data_key)
                 runtime_meta = json.loads(json_str.decode("ascii"))
                 self.internal_storage.del_data(key=data_key)
                 break
             except Exception:
-                time.sleep(2)
+                # Poll often at first, the metadata is usually ready in a few seconds
+                time.sleep(sleep_time)
+                sleep_time = min(sleep_time * 2, 2)
 
         if not runtime_meta or 'preinstalls' not in runtime_meta:
             raise Exception(f'Failed getting runtime metadata: {runtime_meta}')
@@ -18,14 +18,17 @@
 import re
 import os
 import time
+import random
 import logging
 import uuid
 import functools
 import inspect
+import threading
 from datetime import datetime
 from ibm_vpc import VpcV1
 from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
 from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
 from concurrent.futures import ThreadPoolExecutor
 
 from lithops.version import __version__
@@ -36,6 +39,7 @@ from lithops.standalone.utils import (
     CLOUD_CONFIG_WORKER,
     CLOUD_CONFIG_WORKER_PK,
     StandaloneMode,
+    MAX_VM_THREADS,
     get_host_setup_script,
     LithopsValidationError
 )
@@ -47,6 +51,10 @@ VPC_API_VERSION = '2021-09-21'
 
 DEFAULT_LITHOPS_IMAGE_NAME = 'lithops-ubuntu-22-04-3-minimal-amd64-1'
 
+VPC_HTTP_POOL_SIZE = MAX_VM_THREADS
+VPC_CLIENTS = {}
+VPC_CLIENTS_LOCK = threading.Lock()
+
 
 class IBMVPCBackend:
 
@@ -78,15 +86,7 @@ class IBMVPCBackend:
         self.workers = []
 
         self.iam_api_key = self.config.get('iam_api_key')
-        authenticator = IAMAuthenticator(self.iam_api_key, url=self.config.get('iam_endpoint'))
-        self.vpc_cli = VpcV1(VPC_API_VERSION, authenticator=authenticator)
-        self.vpc_cli.set_service_url(self.config['endpoint'] + '/v1')
-
-        user_agent_string = f"ibm_vpc_{self.config['user_agent']}"
-        self.vpc_cli._set_user_agent_header(user_agent_string)
-
-        # decorate instance public methods with except/retry logic
-        decorate_instance(self.vpc_cli, vpc_retry_on_except)
+        self.vpc_cli = get_vpc_client(self.config)
 
         msg = COMPUTE_CLI_MSG.format('IBM VPC')
         logger.info(f"{msg} - Region: {self.region} - Zone: {self.zone}")
@@ -820,7 +820,7 @@ class IBMVPCBackend:
         Stop all worker VM instances
         """
         if len(self.workers) > 0:
-            with ThreadPoolExecutor(min(len(self.workers), 48)) as ex:
+            with ThreadPoolExecutor(min(len(self.workers), MAX_VM_THREADS)) as ex:
                 ex.map(lambda worker: worker.stop(), self.workers)
             self.workers = []
 
@@ -926,14 +926,7 @@ class IBMVPCInstance:
         """
         Creates an IBM VPC python-sdk instance
         """
-        authenticator = IAMAuthenticator(self.config.get('iam_api_key'), url=self.config.get('iam_endpoint'))
-        ibm_vpc_client = VpcV1(VPC_API_VERSION, authenticator=authenticator)
-        ibm_vpc_client.set_service_url(self.config['endpoint'] + '/v1')
-
-        # decorate instance public methods with except/retry logic
-        decorate_instance(self.vpc_cli, vpc_retry_on_except)
-
-        return ibm_vpc_client
+        return get_vpc_client(self.config)
 
     def get_ssh_client(self):
         """
@@ -1107,13 +1100,15 @@ class IBMVPCInstance:
         if not self.private_ip and self.instance_data:
             self.private_ip = self.instance_data['primary_network_interface']['primary_ipv4_address']
 
+        sleep_time = 1
         while not self.private_ip or self.private_ip == '0.0.0.0':
             instance_data = self.get_instance_data()
             private_ip = instance_data['primary_network_interface']['primary_ipv4_address']
             if private_ip != '0.0.0.0':
                 self.private_ip = private_ip
             else:
-                time.sleep(1)
+                time.sleep(sleep_time)
+                sleep_time = min(sleep_time * 1.5, 10)
 
         return self.private_ip
 
@@ -1248,6 +1243,47 @@ class IBMVPCInstance:
                 raise LithopsValidationError(f'Not using single CPU socket as specified, using {len(sockets)} sockets instead')
 
 
+def get_vpc_client(ibm_vpc_config):
+    """
+    Returns an IBM VPC python-sdk instance. Clients are cached per
+    credentials and endpoint, so the IAM token and the HTTP connections
+    are shared by all the backend and VM instance objects of the process
+    """
+    client_key = (
+        ibm_vpc_config.get('iam_api_key'),
+        ibm_vpc_config.get('iam_endpoint'),
+        ibm_vpc_config['endpoint'],
+        ibm_vpc_config.get('user_agent')
+    )
+
+    with VPC_CLIENTS_LOCK:
+        if client_key not in VPC_CLIENTS:
+            authenticator = IAMAuthenticator(ibm_vpc_config.get('iam_api_key'), url=ibm_vpc_config.get('iam_endpoint'))
+            vpc_cli = VpcV1(VPC_API_VERSION, authenticator=authenticator)
+            vpc_cli.set_service_url(ibm_vpc_config['endpoint'] + '/v1')
+
+            # The client is shared by the threads that create or stop VMs in parallel,
+            # so enlarge the keep-alive pool (requests defaults to 10 connections)
+            vpc_cli.http_adapter = SSLHTTPAdapter(
+                pool_connections=VPC_HTTP_POOL_SIZE,
+                pool_maxsize=VPC_HTTP_POOL_SIZE,
+                _disable_ssl_verification=vpc_cli.disable_ssl_verification
+            )
+            vpc_cli.get_http_client().mount('http://', vpc_cli.http_adapter)
+            vpc_cli.get_http_client().mount('https://', vpc_cli.http_adapter)
+
+            if 'user_agent' in ibm_vpc_config:
+                user_agent_string = f"ibm_vpc_{ibm_vpc_config['user_agent']}"
+                vpc_cli._set_user_agent_header(user_agent_string)
+
+            # decorate instance public methods with except/retry logic
+            decorate_instance(vpc_cli, vpc_retry_on_except)
+
+            VPC_CLIENTS[client_key] = vpc_cli
+
+        return VPC_CLIENTS[client_key]
+
+
 RETRIABLE = ['list_vpcs',
              'create_vpc',
              'get_security_group',
@@ -1290,6 +1326,8 @@ def vpc_retry_on_except(func):
     MAX_SLEEP = 30
 
     IGNORED_404_METHODS = ['delete_instance', 'delete_public_gateway', 'delete_vpc', 'create_instance_action']
+    # Client errors that will not succeed on retry. 409 and 429 are transient
+    NOT_RETRIABLE_CODES = [400, 401, 403, 404]
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
@@ -1297,7 +1335,8 @@ def vpc_retry_on_except(func):
 
         def _sleep_or_raise(sleep_time, err):
             if i < RETRIES - 1:
-                time.sleep(sleep_time)
+                # Add jitter so concurrent callers do not retry in lockstep
+                time.sleep(sleep_time + random.uniform(0, 1))
                 logger.warning((f'Got exception {err}, retrying for the {i} time, left retries {RETRIES - 1 -i}'))
                 return min(sleep_time * SLEEP_FACTOR, MAX_SLEEP)
             else:
@@ -1309,7 +1348,9 @@ def vpc_retry_on_except(func):
             except ApiException as err:
                 if func.__name__ in IGNORED_404_METHODS and err.code == 404:
                     # logger.debug((f'Got exception {err} when trying to invoke {func.__name__}, ignoring'))
-                    pass
+                    return None
+                elif err.code in NOT_RETRIABLE_CODES:
+                    raise err
                 else:
                     sleep_time = _sleep_or_raise(sleep_time, err)
             except Exception as err:
@@ -38,6 +38,7 @@ from lithops.constants import (
 )
 from lithops.standalone.utils import (
     StandaloneMode,
+    MAX_VM_THREADS,
     LithopsValidationError,
     get_host_setup_script,
     get_master_setup_script
@@ -237,7 +238,7 @@ class StandaloneHandler:
         def create_workers(workers_to_create):
             current_workers_old = set(self.backend.workers)
             futures = []
-            with cf.ThreadPoolExecutor(min(workers_to_create, 48)) as ex:
+            with cf.ThreadPoolExecutor(min(workers_to_create, MAX_VM_THREADS)) as ex:
                 for vm_n in range(workers_to_create):
                     worker_id = f"{executor_id}-{job_id}-{vm_n}"
                     worker_hash = hashlib.sha1(worker_id.encode("utf-8")).hexdigest()[:8]
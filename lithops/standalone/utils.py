@@ -43,6 +43,9 @@ class LithopsValidationError(Exception):
     pass
 
 
+# Max threads used to create or stop VM instances in parallel
+MAX_VM_THREADS = 48
+
 MASTER_SERVICE_NAME = 'lithops-master.service'
 MASTER_SERVICE_FILE = f"""
 [Unit]
@@ -38,6 +38,11 @@ from contextlib import closing
 from lithops import constants
 from lithops.version import __version__
 
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -339,6 +344,20 @@ def sdb_to_dict(item):
     return {c['Name']: c['Value'] for c in attr}
 
 
+def json_loads(data):
+    """
+    Parses a JSON document using orjson when it is installed. Documents
+    orjson rejects (NaN/Infinity, integers over 64 bits) fall back to
+    the json module
+    """
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def dict_to_b64str(the_dict):
     bytes_dict = json.dumps(the_dict, default=str).encode()
     b64_dict = base64.b64encode(bytes_dict)
@@ -346,7 +365,8 @@ def dict_to_b64str(the_dict):
 
 
 def b64str_to_dict(str_data):
-    b64_dict = base64.b64decode(str_data.encode())
+    # b64decode accepts both str and bytes, no need to encode first
+    b64_dict = base64.b64decode(str_data)
     bytes_dict = json.loads(b64_dict)
 
     return bytes_dict
@@ -359,8 +379,7 @@ def bytes_to_b64str(byte_data):
 
 
 def b64str_to_bytes(str_data):
-    str_ascii = str_data.encode('ascii')
-    byte_data = base64.b64decode(str_ascii)
+    byte_data = base64.b64decode(str_data)
     return byte_data
 
 
@@ -82,6 +82,9 @@ extras_require = {
     'oracle': [
         'oci',
     ],
+    'orjson': [
+        'orjson',
+    ],
     'tests': [
         'pytest',
     ]